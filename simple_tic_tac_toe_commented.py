@@ -2,6 +2,252 @@
 import tkinter as tk
 # Import messagebox for displaying popup dialogs
 from tkinter import messagebox
+# Import functools for caching search results (lru_cache) and
+# binding button callbacks (partial)
+import functools
+
+
+# === BITBOARD CONSTANTS ===
+# Each player's marks are stored as a 9-bit integer (a "bitboard").
+# Bit i is set when that player occupies board position i.
+# Example: X on positions 0, 4 and 8 -> 0b100010001
+
+# All 9 positions occupied (binary 111111111)
+EMPTY_MASK = 0x1FF
+
+# Every winning line as the 3 positions it covers
+_WINS = (
+    # Horizontal wins (rows)
+    (0, 1, 2),  # Top row
+    (3, 4, 5),  # Middle row
+    (6, 7, 8),  # Bottom row
+
+    # Vertical wins (columns)
+    (0, 3, 6),  # Left column
+    (1, 4, 7),  # Middle column
+    (2, 5, 8),  # Right column
+
+    # Diagonal wins
+    (0, 4, 8),  # Top-left to bottom-right diagonal
+    (2, 4, 6),  # Top-right to bottom-left diagonal
+)
+
+# The same winning lines as bitmasks (e.g. top row 0, 1, 2 -> 0b000000111)
+WIN_MASKS = tuple(sum(1 << i for i in line) for line in _WINS)
+
+# Heuristic value of each position, used by A* (index = board position)
+# - Center (4): Most valuable at 4 points
+# - Corners (0,2,6,8): Second most valuable at 3 points
+# - Edges (1,3,5,7): Least valuable at 2 points
+_POSITION_VALUE = (3, 2, 3, 2, 4, 2, 3, 2, 3)
+
+# Order in which DFS visits positions: center, then corners, then edges
+_DFS_PRIORITY = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+
+# Order in which BFS visits positions: plain index order, 0 to 8
+_BFS_ORDER = tuple(range(9))
+
+# Order in which A* visits positions: highest heuristic value first,
+# higher position first on equal values -> (4, 8, 6, 2, 0, 7, 5, 3, 1)
+_ASTAR_ORDER = tuple(sorted(range(9), key=lambda i: (_POSITION_VALUE[i], i), reverse=True))
+
+# Win lookup table for all 2^9 = 512 possible bitboards
+# _WIN_LUT[bb] is 1 if bitboard bb contains at least one winning line, else 0
+# Checking a win is then a single array index instead of 8 mask tests
+# The same table works for both players (just pass X's or O's bitboard)
+_WIN_LUT = bytearray(512)
+for _bb in range(512):
+    _WIN_LUT[_bb] = any((_bb & mask) == mask for mask in WIN_MASKS)
+del _bb
+
+# === BOARD SYMMETRIES ===
+# The board looks the same after rotating or mirroring it, so every position
+# has up to 8 equivalent versions. Each tuple lists, for new position j,
+# which old position it is taken from: new[j] = old[perm[j]]
+SYM_PERMS = (
+    (0, 1, 2, 3, 4, 5, 6, 7, 8),  # Identity
+    (6, 3, 0, 7, 4, 1, 8, 5, 2),  # Rotate 90 degrees clockwise
+    (8, 7, 6, 5, 4, 3, 2, 1, 0),  # Rotate 180 degrees
+    (2, 5, 8, 1, 4, 7, 0, 3, 6),  # Rotate 270 degrees clockwise
+    (2, 1, 0, 5, 4, 3, 8, 7, 6),  # Mirror left <-> right
+    (6, 7, 8, 3, 4, 5, 0, 1, 2),  # Mirror top <-> bottom
+    (0, 3, 6, 1, 4, 7, 2, 5, 8),  # Mirror along the 0-4-8 diagonal
+    (8, 5, 2, 7, 4, 1, 6, 3, 0),  # Mirror along the 2-4-6 diagonal
+)
+
+# PERM_TABLES[s][bb] is bitboard bb transformed by symmetry s
+# 8 symmetries x 512 bitboards = 4096 entries, built once at import time
+PERM_TABLES = tuple(
+    tuple(
+        sum(1 << j for j in range(9) if (bb >> perm[j]) & 1)
+        for bb in range(512)
+    )
+    for perm in SYM_PERMS
+)
+
+
+def canonicalize(x_bb, o_bb):
+    """
+    Finds the canonical version of a board among its 8 symmetric versions.
+
+    All symmetric boards share the same canonical version (the smallest
+    (x_bb, o_bb) pair), so they can share a single lookup table entry.
+
+    Parameters:
+        x_bb (int): Bitboard of X's marks
+        o_bb (int): Bitboard of O's marks
+
+    Returns:
+        tuple: (canonical x_bb, canonical o_bb, symmetry index used)
+               Position j on the canonical board is position SYM_PERMS[s][j]
+               on the original board.
+    """
+    return min((table[x_bb], table[o_bb], s) for s, table in enumerate(PERM_TABLES))
+
+
+@functools.lru_cache(maxsize=None)
+def _alphabeta(x_bb, o_bb, maximizing, alpha, beta, order):
+    """
+    Minimax search with alpha-beta pruning over the full game tree.
+
+    How it works:
+    - O (AI) is the maximizing player, X (player) the minimizing player
+    - Positions are tried in the given order; better orders prune more
+    - Faster wins score higher (1 + empty squares left after the winning move),
+      so the AI finishes the game instead of dragging it out
+    - Branches that cannot change the result (alpha >= beta) are skipped
+    - The board is just two ints, so every call is cached by lru_cache
+
+    Parameters:
+        x_bb (int): Bitboard of X's marks
+        o_bb (int): Bitboard of O's marks
+        maximizing (bool): True if O is to move, False if X is to move
+        alpha (int): Best score O is already guaranteed
+        beta (int): Best score X is already guaranteed
+        order (tuple): The order in which to try positions (0-8)
+
+    Returns:
+        tuple: (score, best position) - positive score = O wins, negative = X wins
+    """
+    occupied = x_bb | o_bb
+    # Number of occupied positions (int.bit_count is a single popcount)
+    filled = occupied.bit_count()
+
+    # Only one empty position left: the move is forced, no need to loop
+    if filled == 8:
+        i = (occupied ^ EMPTY_MASK).bit_length() - 1
+        mover = (o_bb if maximizing else x_bb) | (1 << i)
+        # Filling the last position either wins (with 0 empties left) or draws
+        if _WIN_LUT[mover]:
+            return (1 if maximizing else -1), i
+        return 0, i
+
+    # Empty positions that will be left once this move is made
+    empties_left = 8 - filled
+
+    # O looks for the highest score, X for the lowest
+    best_score = -10 if maximizing else 10
+    best_move = None
+
+    for i in order:
+        # Skip occupied positions
+        if (occupied >> i) & 1:
+            continue
+
+        bit = 1 << i
+        if maximizing:
+            # Place O's mark
+            mover = o_bb | bit
+            if _WIN_LUT[mover]:
+                # This move wins the game right away
+                score = 1 + empties_left
+            elif empties_left == 0:
+                # Board is full with no winner: draw
+                score = 0
+            else:
+                score = _alphabeta(x_bb, mover, False, alpha, beta, order)[0]
+
+            if score > best_score:
+                best_score, best_move = score, i
+            alpha = max(alpha, score)
+        else:
+            # Place X's mark
+            mover = x_bb | bit
+            if _WIN_LUT[mover]:
+                score = -(1 + empties_left)
+            elif empties_left == 0:
+                score = 0
+            else:
+                score = _alphabeta(mover, o_bb, True, alpha, beta, order)[0]
+
+            if score < best_score:
+                best_score, best_move = score, i
+            beta = min(beta, score)
+
+        # The opponent will never allow this line of play: prune the rest
+        if alpha >= beta:
+            break
+
+    return best_score, best_move
+
+
+def _build_lut():
+    """
+    Precomputes the perfect-play move for every board the AI can face.
+
+    How it works:
+    Tic-tac-toe only has 5478 reachable positions, so we can visit all of them
+    once when the module is imported and solve each one with _alphabeta().
+    - Boards are canonicalized first, so symmetric boards are solved only once
+    - X (player) always moves first, O (AI) second
+
+    Returns:
+        dict: Maps canonical (x_bb, o_bb) with O to move -> best position (0-8)
+              on the canonical board
+    """
+    lut = {}
+    seen = set()
+
+    def visit(x_bb, o_bb, o_to_move):
+        # Work on the canonical board so symmetric boards share one entry
+        x_bb, o_bb, _ = canonicalize(x_bb, o_bb)
+
+        # Every position is only visited once
+        if (x_bb, o_bb) in seen:
+            return
+        seen.add((x_bb, o_bb))
+
+        occupied = x_bb | o_bb
+        # Stop at finished games (someone won, or the board is full)
+        if _WIN_LUT[x_bb] or _WIN_LUT[o_bb] or occupied == EMPTY_MASK:
+            return
+
+        if o_to_move:
+            lut[(x_bb, o_bb)] = _alphabeta(x_bb, o_bb, True, -10, 10, _BFS_ORDER)[1]
+
+        # Visit every board reachable with one more move
+        for i in range(9):
+            if not (occupied >> i) & 1:
+                if o_to_move:
+                    visit(x_bb, o_bb | (1 << i), False)
+                else:
+                    visit(x_bb | (1 << i), o_bb, True)
+
+    # Start from the empty board with X to move
+    visit(0, 0, False)
+    return lut
+
+
+# Perfect-play lookup table, built once at import time
+_LUT = _build_lut()
+
+# Popup (title, message) for each way a game can end, used by check_end()
+# {algo} is replaced with the name of the selected AI algorithm
+_END_MESSAGES = {
+    'X': ("You Win!", "Congratulations! 🎉\n\nRematch with same AI?"),
+    'O': ("AI Wins", "AI ({algo}) won!\n\nRematch?"),
+    'D': ("Draw", "It's a tie!\n\nRematch?"),
+}
 
 
 class SimpleTicTacToe:
@@ -24,7 +270,8 @@ class SimpleTicTacToe:
         # Set window size to 400 pixels wide and 500 pixels tall
         self.window.geometry("400x500")
 
-        # Initialize the game board as a list of 9 empty strings
+        # Initialize the game board as two empty bitboards, one per player
+        # Bit i of x_bb is set when X is on position i (same for o_bb and O)
         # Index mapping: [0,1,2] = top row, [3,4,5] = middle row, [6,7,8] = bottom row
         # Example board layout:
         # 0 | 1 | 2
@@ -32,14 +279,19 @@ class SimpleTicTacToe:
         # 3 | 4 | 5
         # ---------
         # 6 | 7 | 8
-        self.board = ['' for _ in range(9)]
+        self.x_bb = 0
+        self.o_bb = 0
 
-        # List to store references to all 9 button widgets on the board
-        self.buttons = []
+        # Tuple of references to all 9 button widgets on the board
+        # (filled in by create_ui, never changes afterwards)
+        self.buttons = ()
 
         # Default AI algorithm is BFS (Breadth-First Search)
         self.algorithm = "BFS"
 
+        # Maps each algorithm name to the method that picks the AI's move
+        self._ai_dispatch = {"BFS": self.bfs, "DFS": self.dfs, "A*": self.astar}
+
         # Flag to track if the current game has ended (win/loss/draw)
         self.game_over = False
 
@@ -65,17 +317,17 @@ class SimpleTicTacToe:
         tk.Label(algo_frame, text="Choose AI:", font=('Arial', 11)).grid(row=0, column=0, padx=5)
 
         # Create BFS button - when clicked, sets algorithm to BFS
-        # lambda: creates an anonymous function that calls set_algorithm("BFS")
+        # functools.partial: creates a callable that calls set_algorithm("BFS")
         tk.Button(algo_frame, text="BFS", width=8, bg='lightblue',
-                 command=lambda: self.set_algorithm("BFS")).grid(row=0, column=1, padx=3)
+                 command=functools.partial(self.set_algorithm, "BFS")).grid(row=0, column=1, padx=3)
 
         # Create DFS button - when clicked, sets algorithm to DFS
         tk.Button(algo_frame, text="DFS", width=8, bg='lightgreen',
-                 command=lambda: self.set_algorithm("DFS")).grid(row=0, column=2, padx=3)
+                 command=functools.partial(self.set_algorithm, "DFS")).grid(row=0, column=2, padx=3)
 
         # Create A* button - when clicked, sets algorithm to A*
         tk.Button(algo_frame, text="A*", width=8, bg='lightyellow',
-                 command=lambda: self.set_algorithm("A*")).grid(row=0, column=3, padx=3)
+                 command=functools.partial(self.set_algorithm, "A*")).grid(row=0, column=3, padx=3)
 
         # Create a label to display which algorithm is currently selected
         self.algo_label = tk.Label(self.window, text="AI: BFS", font=('Arial', 12, 'bold'), fg='blue')
@@ -86,13 +338,21 @@ class SimpleTicTacToe:
         board_frame = tk.Frame(self.window)
         board_frame.pack(pady=20)
 
+        # One StringVar per position holds the text shown on its button
+        # Updating a square is then just var.set('X') instead of a full config()
+        self._vars = tuple(tk.StringVar(self.window, value='') for _ in range(9))
+
+        # Collect the buttons in a local list while creating them
+        btns = []
+
         # Loop through positions 0-8 to create 9 buttons
         for i in range(9):
             # Create a button for each board position
-            # lambda pos=i: captures the current value of i for this button
-            btn = tk.Button(board_frame, text='', font=('Arial', 24, 'bold'),
+            # functools.partial binds the current value of i for this button
+            # textvariable links the button's text to this position's StringVar
+            btn = tk.Button(board_frame, textvariable=self._vars[i], font=('Arial', 24, 'bold'),
                           width=5, height=2, bg='white',
-                          command=lambda pos=i: self.player_click(pos))
+                          command=functools.partial(self.player_click, i))
 
             # Position the button in a 3x3 grid
             # i//3 gives the row (0, 1, or 2)
@@ -100,16 +360,20 @@ class SimpleTicTacToe:
             btn.grid(row=i//3, column=i%3, padx=2, pady=2)
 
             # Add this button to our list so we can reference it later
-            self.buttons.append(btn)
+            btns.append(btn)
+
+        # The board never gains or loses buttons, so store them as a tuple
+        self.buttons = tuple(btns)
 
         # === CONTROL BUTTONS SECTION ===
         # Create a frame to hold the New Game and Rematch buttons
         btn_frame = tk.Frame(self.window)
         btn_frame.pack(pady=10)
 
-        # Create "New Game" button - resets the game completely
+        # Create "New Game" button - clears the board (algorithm can be changed any time)
+        # Both control buttons share rematch(), since a new game is just an empty board
         tk.Button(btn_frame, text="New Game", font=('Arial', 12),
-                 bg='orange', width=12, command=self.reset).pack(side=tk.LEFT, padx=5)
+                 bg='orange', width=12, command=self.rematch).pack(side=tk.LEFT, padx=5)
 
         # Create "Rematch" button - starts a new game with the same AI
         tk.Button(btn_frame, text="Rematch", font=('Arial', 12),
@@ -136,12 +400,10 @@ class SimpleTicTacToe:
             pos (int): The position clicked (0-8)
         """
         # Check if the position is empty AND the game is still ongoing
-        if self.board[pos] == '' and not self.game_over:
-            # Place player's mark (X) on the board
-            self.board[pos] = 'X'
-
-            # Update the button to show X in blue color and disable it
-            self.buttons[pos].config(text='X', fg='blue', state='disabled')
+        # A position is empty when its bit is set in neither bitboard
+        if not ((self.x_bb | self.o_bb) >> pos) & 1 and not self.game_over:
+            # Place player's mark (X) on the board and its button
+            self._set_square(pos, 'X')
 
             # Check if the game ended (player won or draw)
             if not self.check_end():
@@ -149,25 +411,47 @@ class SimpleTicTacToe:
                 # This delay makes the game feel more natural
                 self.window.after(300, self.ai_turn)
 
+    def _set_square(self, pos, player):
+        """
+        Places a player's mark on the board and updates its button.
+
+        Parameters:
+            pos (int): The position to mark (0-8)
+            player (str): Either 'X' (shown in blue) or 'O' (shown in red)
+        """
+        # Set the position's bit in the player's bitboard
+        if player == 'X':
+            self.x_bb |= 1 << pos
+            color = 'blue'
+        else:
+            self.o_bb |= 1 << pos
+            color = 'red'
+
+        # Show the mark on the button (through its StringVar) and disable it
+        self._vars[pos].set(player)
+        self.buttons[pos].config(fg=color, state='disabled')
+
     def ai_turn(self):
         """
-        AI's turn to make a move. Calls the appropriate algorithm based on selection.
+        AI's turn to make a move. Looks up the precomputed perfect-play move,
+        falling back to the selected algorithm if the board is not in the table.
         """
-        # Check which algorithm is selected and call the corresponding method
-        if self.algorithm == "BFS":
-            move = self.bfs()  # Get move using Breadth-First Search
-        elif self.algorithm == "DFS":
-            move = self.dfs()  # Get move using Depth-First Search
-        else:  # A*
-            move = self.astar()  # Get move using A* algorithm
+        # Every reachable board is in the lookup table (in canonical form)
+        x_bb, o_bb, sym = canonicalize(self.x_bb, self.o_bb)
+        move = _LUT.get((x_bb, o_bb))
+
+        # Map the move from the canonical board back onto the real board
+        if move is not None:
+            move = SYM_PERMS[sym][move]
+
+        # Fallback (should never happen): call the selected algorithm instead
+        if move is None:
+            move = self._ai_dispatch[self.algorithm]()
 
         # If a valid move was found (not None)
         if move is not None:
             # Place AI's mark (O) on the board at the chosen position
-            self.board[move] = 'O'
-
-            # Update the button to show O in red color and disable it
-            self.buttons[move].config(text='O', fg='red', state='disabled')
+            self._set_square(move, 'O')
 
             # Check if the game ended after AI's move
             self.check_end()
@@ -177,232 +461,64 @@ class SimpleTicTacToe:
         BFS (Breadth-First Search) Algorithm
 
         How it works:
-        1. First level: Check all positions to see if AI can win immediately
-        2. Second level: Check all positions to see if must block player
-        3. Third level: Choose strategic positions (center > corners > edges)
+        Runs the alpha-beta game-tree search, trying positions level by level
+        in plain index order (0, 1, 2, ... 8).
 
-        BFS explores all possibilities at each level before moving to the next level.
+        The search looks ahead to the end of the game, so it always finds a
+        perfect move (it never loses, and it sees through fork traps).
 
         Returns:
             int: The position (0-8) where AI should move, or None if no moves available
         """
-
-        # === LEVEL 1: OFFENSIVE - Try to win immediately ===
-        # Loop through all 9 positions
-        for i in range(9):
-            # Check if this position is empty
-            if self.board[i] == '':
-                # Temporarily place AI's mark (O) here
-                self.board[i] = 'O'
-
-                # Check if this move would make AI win
-                if self.is_winner('O'):
-                    # Remove the temporary mark
-                    self.board[i] = ''
-                    # Return this position - it's a winning move!
-                    return i
-
-                # This move doesn't win, so remove the temporary mark
-                self.board[i] = ''
-
-        # === LEVEL 2: DEFENSIVE - Block player from winning ===
-        # Loop through all 9 positions again
-        for i in range(9):
-            # Check if this position is empty
-            if self.board[i] == '':
-                # Temporarily place player's mark (X) here
-                self.board[i] = 'X'
-
-                # Check if player would win with this move
-                if self.is_winner('X'):
-                    # Remove the temporary mark
-                    self.board[i] = ''
-                    # Return this position - we must block it!
-                    return i
-
-                # Player wouldn't win here, remove temporary mark
-                self.board[i] = ''
-
-        # === LEVEL 3: STRATEGIC - Choose best available position ===
-
-        # Strategy 1: Take the center if available (position 4)
-        # Center is the most valuable position in tic-tac-toe
-        if self.board[4] == '':
-            return 4
-
-        # Strategy 2: Take a corner if available
-        # Corners (positions 0, 2, 6, 8) are second most valuable
-        for corner in [0, 2, 6, 8]:
-            if self.board[corner] == '':
-                return corner
-
-        # Strategy 3: Take any remaining edge position
-        # If center and corners are taken, choose any empty position
-        for i in range(9):
-            if self.board[i] == '':
-                return i
+        return _alphabeta(self.x_bb, self.o_bb, True, -10, 10, _BFS_ORDER)[1]
 
     def dfs(self):
         """
         DFS (Depth-First Search) Algorithm
 
         How it works:
-        DFS follows a predefined priority order and explores deeply:
-        1. Check positions in priority order for immediate win
-        2. Check positions in priority order to block player
-        3. Return first available position in priority order
+        Runs the alpha-beta game-tree search, following a predefined priority
+        order and exploring each branch deeply before backtracking.
 
         Priority: center (4) > corners (0,2,6,8) > edges (1,3,5,7)
 
-        DFS differs from BFS by following a specific path deeply before backtracking,
-        rather than checking all positions at each level.
-
         Returns:
             int: The position (0-8) where AI should move, or None if no moves available
         """
-
-        # Define the priority order for checking positions
-        # Position 4 (center) is highest priority, then corners, then edges
-        # This creates a "depth-first" exploration path
-        priority = [4, 0, 2, 6, 8, 1, 3, 5, 7]
-
-        # === DEPTH 1: OFFENSIVE - Try to win immediately ===
-        # Loop through positions in priority order
-        for i in priority:
-            # Check if this prioritized position is empty
-            if self.board[i] == '':
-                # Temporarily place AI's mark (O)
-                self.board[i] = 'O'
-
-                # Check if this is a winning move
-                if self.is_winner('O'):
-                    # Remove temporary mark
-                    self.board[i] = ''
-                    # Return winning position
-                    return i
-
-                # Not a winning move, remove temporary mark
-                self.board[i] = ''
-
-        # === DEPTH 2: DEFENSIVE - Block player ===
-        # Loop through positions in priority order again
-        for i in priority:
-            # Check if this prioritized position is empty
-            if self.board[i] == '':
-                # Temporarily place player's mark (X)
-                self.board[i] = 'X'
-
-                # Check if player would win with this move
-                if self.is_winner('X'):
-                    # Remove temporary mark
-                    self.board[i] = ''
-                    # Must block this position
-                    return i
-
-                # Player wouldn't win, remove temporary mark
-                self.board[i] = ''
-
-        # === DEPTH 3: STRATEGIC - Follow priority order ===
-        # No immediate threats, so follow the priority list
-        for i in priority:
-            # Return the first empty position in priority order
-            if self.board[i] == '':
-                return i
+        return _alphabeta(self.x_bb, self.o_bb, True, -10, 10, _DFS_PRIORITY)[1]
 
     def astar(self):
         """
         A* (A-Star) Algorithm
 
         How it works:
-        A* uses a heuristic function (scoring system) to evaluate each move:
-        1. First check for immediate win (highest priority)
-        2. Then check for blocking moves (second priority)
-        3. Finally, score all empty positions and choose the highest score
+        Runs the alpha-beta game-tree search, trying the positions with the
+        best heuristic score first.
 
         Scoring heuristic:
         - Center (position 4): 4 points
         - Corners (positions 0,2,6,8): 3 points
         - Edges (positions 1,3,5,7): 2 points
 
-        A* is optimal because it always chooses the move with the best score,
-        combining both cost (position value) and heuristic (strategic importance).
+        Trying strong moves first lets alpha-beta prune more of the tree.
 
         Returns:
             int: The position (0-8) where AI should move, or None if no moves available
         """
+        return _alphabeta(self.x_bb, self.o_bb, True, -10, 10, _ASTAR_ORDER)[1]
 
-        # === STEP 1: IMMEDIATE WIN CHECK ===
-        # Loop through all positions to find a winning move
-        for i in range(9):
-            # Check if position is empty
-            if self.board[i] == '':
-                # Temporarily place AI's mark (O)
-                self.board[i] = 'O'
-
-                # Check if this move wins the game
-                if self.is_winner('O'):
-                    # Remove temporary mark
-                    self.board[i] = ''
-                    # Return winning move (highest priority)
-                    return i
-
-                # Not a winning move, remove temporary mark
-                self.board[i] = ''
-
-        # === STEP 2: BLOCKING CHECK ===
-        # Loop through all positions to find blocking moves
-        for i in range(9):
-            # Check if position is empty
-            if self.board[i] == '':
-                # Temporarily place player's mark (X)
-                self.board[i] = 'X'
-
-                # Check if player would win with this move
-                if self.is_winner('X'):
-                    # Remove temporary mark
-                    self.board[i] = ''
-                    # Must block this move
-                    return i
-
-                # Player wouldn't win, remove temporary mark
-                self.board[i] = ''
-
-        # === STEP 3: HEURISTIC SCORING ===
-        # No immediate threats, so score each empty position
-
-        # Create empty list to store (score, position) tuples
-        scores = []
-
-        # Define the heuristic values for each position
-        # Index corresponds to board position (0-8)
-        # These values represent strategic importance:
-        # - Center (4): Most valuable at 4 points
-        # - Corners (0,2,6,8): Second most valuable at 3 points
-        # - Edges (1,3,5,7): Least valuable at 2 points
-        position_value = [3, 2, 3, 2, 4, 2, 3, 2, 3]
-
-        # Calculate score for each empty position
-        for i in range(9):
-            # Only consider empty positions
-            if self.board[i] == '':
-                # Get the heuristic score for this position
-                score = position_value[i]
-
-                # Add (score, position) tuple to our list
-                # We store as tuple so we can sort by score
-                scores.append((score, i))
-
-        # === STEP 4: SELECT BEST MOVE ===
-        # If we have any possible moves
-        if scores:
-            # Sort scores in descending order (highest score first)
-            # reverse=True means sort from high to low
-            scores.sort(reverse=True)
-
-            # Return the position with the highest score
-            # scores[0] is the tuple with highest score
-            # scores[0][1] extracts just the position (second element of tuple)
-            return scores[0][1]
+    @staticmethod
+    def _wins(bb):
+        """
+        Checks if a bitboard contains a complete winning line.
+
+        Parameters:
+            bb (int): A player's bitboard (real or hypothetical)
+
+        Returns:
+            int: 1 if the bitboard has three in a row, 0 otherwise
+        """
+        return _WIN_LUT[bb]
 
     def is_winner(self, player):
         """
@@ -412,7 +528,7 @@ class SimpleTicTacToe:
             player (str): Either 'X' or 'O'
 
         Returns:
-            bool: True if the player has won, False otherwise
+            int: 1 if the player has won, 0 otherwise
 
         Win conditions:
             - Three in a row horizontally
@@ -420,35 +536,11 @@ class SimpleTicTacToe:
             - Three in a row diagonally
         """
 
-        # Define all possible winning combinations
-        # Each inner list represents a winning line of 3 positions
-        wins = [
-            # Horizontal wins (rows)
-            [0, 1, 2],  # Top row: positions 0, 1, 2
-            [3, 4, 5],  # Middle row: positions 3, 4, 5
-            [6, 7, 8],  # Bottom row: positions 6, 7, 8
-
-            # Vertical wins (columns)
-            [0, 3, 6],  # Left column: positions 0, 3, 6
-            [1, 4, 7],  # Middle column: positions 1, 4, 7
-            [2, 5, 8],  # Right column: positions 2, 5, 8
-
-            # Diagonal wins
-            [0, 4, 8],  # Top-left to bottom-right diagonal
-            [2, 4, 6]   # Top-right to bottom-left diagonal
-        ]
-
-        # Check each possible winning combination
-        for combo in wins:
-            # all() returns True only if ALL positions in combo contain the player's mark
-            # Example: if combo is [0,1,2] and player is 'X'
-            #          checks if board[0]=='X' AND board[1]=='X' AND board[2]=='X'
-            if all(self.board[i] == player for i in combo):
-                # This player has won!
-                return True
-
-        # No winning combination found
-        return False
+        # Pick the bitboard that belongs to this player
+        bb = self.o_bb if player == 'O' else self.x_bb
+
+        # Look the bitboard up in the precomputed win table
+        return _WIN_LUT[bb]
 
     def check_end(self):
         """
@@ -458,89 +550,51 @@ class SimpleTicTacToe:
             bool: True if game is over, False if game continues
         """
 
-        # === CHECK FOR PLAYER WIN ===
-        if self.is_winner('X'):
-            # Set flag to prevent further moves
-            self.game_over = True
-
-            # Show victory popup with Yes/No buttons
-            # Returns True if user clicks "Yes", False if "No"
-            result = messagebox.askyesno("You Win!", 
-                                        "Congratulations! 🎉\n\nRematch with same AI?")
-
-            # If user wants rematch
-            if result:
-                self.rematch()  # Start new game with same AI
-
-            return True  # Game is over
-
-        # === CHECK FOR AI WIN ===
-        if self.is_winner('O'):
-            # Set flag to prevent further moves
-            self.game_over = True
-
-            # Show loss popup with algorithm name
-            result = messagebox.askyesno("AI Wins", 
-                                        f"AI ({self.algorithm}) won!\n\nRematch?")
-
-            # If user wants rematch
-            if result:
-                self.rematch()  # Start new game with same AI
-
-            return True  # Game is over
+        # Work out the outcome with three integer tests on the bitboards:
+        # 'X' = player won, 'O' = AI won, 'D' = draw (every position occupied)
+        if self._wins(self.x_bb):
+            outcome = 'X'
+        elif self._wins(self.o_bb):
+            outcome = 'O'
+        elif (self.x_bb | self.o_bb) == EMPTY_MASK:
+            outcome = 'D'
+        else:
+            # Game continues
+            return False
 
-        # === CHECK FOR DRAW ===
-        # If there are no empty positions left ('' not in board)
-        if '' not in self.board:
-            # Set flag to prevent further moves
-            self.game_over = True
+        # Set flag to prevent further moves
+        self.game_over = True
 
-            # Show draw popup
-            result = messagebox.askyesno("Draw", 
-                                        "It's a tie!\n\nRematch?")
+        # Show the popup for this outcome with Yes/No buttons
+        # Returns True if user clicks "Yes", False if "No"
+        title, message = _END_MESSAGES[outcome]
+        result = messagebox.askyesno(title, message.format(algo=self.algorithm))
 
-            # If user wants rematch
-            if result:
-                self.rematch()  # Start new game with same AI
+        # If user wants rematch
+        if result:
+            self.rematch()  # Start new game with same AI
 
-            return True  # Game is over
-
-        # Game continues
-        return False
+        return True  # Game is over
 
     def rematch(self):
         """
         Starts a new game while keeping the same AI algorithm selected.
-        This is like a "quick restart" button.
+        Used by both the "New Game" and "Rematch" buttons.
         """
-        # Reset the board to all empty positions
-        self.board = ['' for _ in range(9)]
+        # Reset the board to all empty positions (clear every bit)
+        self.x_bb = 0
+        self.o_bb = 0
 
         # Reset the game over flag so players can make moves again
         self.game_over = False
 
         # Reset all buttons to their initial state
-        for btn in self.buttons:
-            # Clear the text (X or O)
+        for var, btn in zip(self._vars, self.buttons):
+            # Clear the text (X or O) through the button's StringVar
+            var.set('')
             # Enable the button (state='normal')
             # Reset background color to white
-            btn.config(text='', state='normal', bg='white')
-
-    def reset(self):
-        """
-        Starts a completely new game.
-        Same as rematch(), but semantically allows changing the algorithm.
-        """
-        # Reset the board to all empty positions
-        self.board = ['' for _ in range(9)]
-
-        # Reset the game over flag
-        self.game_over = False
-
-        # Reset all buttons to their initial state
-        for btn in self.buttons:
-            # Clear the text, enable button, reset color
-            btn.config(text='', state='normal', bg='white')
+            btn.config(state='normal', bg='white')
 
     def run(self):
         """